@@ -1,7 +1,6 @@
 author="Vatsal Varshney"
 import streamlit as st
-import os
-from modules import hackathon_discovery, ai_assistant, team_formation, idea_board
+import importlib
 
 # Set page configuration
 st.set_page_config(
@@ -24,33 +23,51 @@ if 'ideas' not in st.session_state:
 if 'gemini_api_key' not in st.session_state:
     st.session_state.gemini_api_key = ""
 
+# Feature modules are imported on first visit, so a page only loads the libraries it renders with
+PAGE_MODULES = {
+    "🔍 Hackathon Discovery": "modules.hackathon_discovery",
+    "💡 Idea Board": "modules.idea_board",
+    "👥 Team Formation": "modules.team_formation",
+    "🤖 AI Assistant": "modules.ai_assistant"
+}
+
+
+# Static page chrome, defined once at import instead of rebuilt inside main()
+# Creator attribution - appears on every page
+BADGE_HTML = """
+<div style="position: fixed; top: 10px; right: 10px; z-index: 999; 
+            background: linear-gradient(45deg, #ff6b6b, #4ecdc4); 
+            color: white; padding: 8px 15px; border-radius: 25px; 
+            font-weight: bold; font-size: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+            animation: glow 2s ease-in-out infinite alternate;">
+    🚀 Created by Vatsal Varshney
+</div>
+<style>
+@keyframes glow {
+    from { box-shadow: 0 4px 15px rgba(0,0,0,0.2); }
+    to { box-shadow: 0 6px 25px rgba(255,107,107,0.4); }
+}
+</style>
+"""
+
+HEADER_HTML = """
+<div style="text-align: center; padding: 1rem 0; margin-bottom: 2rem;">
+    <h1 style="color: #FF6B35; margin: 0;">🚀 HackHub</h1>
+    <p style="color: #666; margin: 0.5rem 0 0 0; font-size: 1.2rem;">Your Complete Hackathon Platform</p>
+    <p style="color: #888; margin: 0; font-size: 0.9rem;">Discover • Connect • Create • Compete</p>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 1rem 0;">
+    <p>Built By VATSAL VARSHNEY</p>
+</div>
+"""
+
 
 def main():
-    # Creator attribution - appears on every page
-    st.markdown("""
-    <div style="position: fixed; top: 10px; right: 10px; z-index: 999; 
-                background: linear-gradient(45deg, #ff6b6b, #4ecdc4); 
-                color: white; padding: 8px 15px; border-radius: 25px; 
-                font-weight: bold; font-size: 12px; box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-                animation: glow 2s ease-in-out infinite alternate;">
-        🚀 Created by Vatsal Varshney
-    </div>
-    <style>
-    @keyframes glow {
-        from { box-shadow: 0 4px 15px rgba(0,0,0,0.2); }
-        to { box-shadow: 0 6px 25px rgba(255,107,107,0.4); }
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Main header
-    st.markdown("""
-    <div style="text-align: center; padding: 1rem 0; margin-bottom: 2rem;">
-        <h1 style="color: #FF6B35; margin: 0;">🚀 HackHub</h1>
-        <p style="color: #666; margin: 0.5rem 0 0 0; font-size: 1.2rem;">Your Complete Hackathon Platform</p>
-        <p style="color: #888; margin: 0; font-size: 0.9rem;">Discover • Connect • Create • Compete</p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Creator attribution and main header
+    st.markdown(BADGE_HTML + HEADER_HTML, unsafe_allow_html=True)
 
     # Sidebar navigation
     st.sidebar.title("🎯 Navigation")
@@ -58,19 +75,14 @@ def main():
     # API Key setup in sidebar
     st.sidebar.markdown("---")
     st.sidebar.subheader("🔑 API Configuration")
-    api_key = st.sidebar.text_input(
+    st.sidebar.text_input(
         "Gemini API Key",
-        value=st.session_state.gemini_api_key,
+        key="gemini_api_key",
         type="password",
         help="Enter your Google Gemini API key for AI features"
     )
 
-    if api_key != st.session_state.gemini_api_key:
-        st.session_state.gemini_api_key = api_key
-        if api_key:
-            os.environ["GEMINI_API_KEY"] = api_key
-
-    if not api_key:
+    if not st.session_state.gemini_api_key:
         st.sidebar.info("💡 Add your Gemini API key to enable AI features!")
         st.sidebar.markdown("[Get API Key](https://makersuite.google.com/app/apikey)")
     else:
@@ -81,12 +93,7 @@ def main():
     # Navigation menu
     page = st.sidebar.radio(
         "Choose Module",
-        [
-            "🔍 Hackathon Discovery",
-            "💡 Idea Board",
-            "👥 Team Formation",
-            "🤖 AI Assistant"
-        ]
+        list(PAGE_MODULES.keys())
     )
 
     # Platform stats in sidebar
@@ -101,22 +108,11 @@ def main():
         st.metric("Teams", len(st.session_state.teams))
 
     # Route to appropriate module
-    if page == "🔍 Hackathon Discovery":
-        hackathon_discovery.render()
-    elif page == "💡 Idea Board":
-        idea_board.render()
-    elif page == "👥 Team Formation":
-        team_formation.render()
-    elif page == "🤖 AI Assistant":
-        ai_assistant.render()
+    importlib.import_module(PAGE_MODULES[page]).render()
 
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 1rem 0;">
-        <p>Built By VATSAL VARSHNEY</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
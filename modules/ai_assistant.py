@@ -1,6 +1,117 @@
 import streamlit as st
 import os
-from utils.gemini_client import GeminiClient
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from utils.gemini_client import get_gemini_client, EMPTY_RESPONSE
+
+# Static system instructions; the user's input is always sent separately so the
+# instruction prefix stays byte-identical across calls
+CHAT_SYSTEM_PROMPT = "Answer in 1-2 sentences. Be direct. Brief answer only."
+TEAM_SYSTEM_PROMPT = "Give the strengths and best project type for the hackathon team described. Be brief."
+IDEAS_SYSTEM_PROMPT = "Suggest 3 hackathon ideas for the given areas. Quick format: Title - short description."
+TIPS_SYSTEM_PROMPT = "Give 5 hackathon presentation tips for the given project."
+
+# How long generated answers are reused, for both the response cache and streamed chat answers
+RESPONSE_CACHE_TTL = 3600
+# Streamed answers are shared by every session, so the store is capped and locked
+STREAMED_ANSWERS_MAX = 256
+STREAMED_ANSWERS_LOCK = threading.Lock()
+
+# Idea generator options, shared across reruns
+INTEREST_OPTIONS = ("AI/ML", "Web Dev", "Mobile", "Blockchain", "IoT",
+                    "Healthcare", "Fintech", "Gaming", "AR/VR")
+SKILL_OPTIONS = ("Python", "JavaScript", "React", "Node.js", "Flutter",
+                 "TensorFlow", "Cloud", "Databases", "UI/UX")
+
+
+class UncachedResponse(Exception):
+    """Carries a failed response out of a cached function so it is shown but not cached"""
+
+    def __init__(self, response):
+        super().__init__("Gemini returned an empty response")
+        self.response = response
+
+
+@st.cache_data(ttl=RESPONSE_CACHE_TTL, show_spinner=False)
+def cached_generate_response(prompt, system_instruction, temperature, max_tokens, key_fingerprint, _api_key):
+    """Generate a response, serving identical prompts from the cache"""
+    # _api_key is excluded from the cache key; key_fingerprint keeps entries per key
+    response = get_gemini_client(_api_key).generate_response(prompt, temperature=temperature, max_tokens=max_tokens,
+                                                             system_instruction=system_instruction)
+    # Raising skips the cache, so the next identical prompt tries again
+    if response == EMPTY_RESPONSE:
+        raise UncachedResponse(response)
+    return response
+
+
+def generate_cached_response(prompt, system_instruction=None, temperature=0.7, max_tokens=300):
+    """Generate a response with the configured API key through the response cache"""
+    api_key = st.session_state.gemini_api_key
+    key_fingerprint = hashlib.sha1(api_key.encode()).hexdigest()[:8]
+    try:
+        return cached_generate_response(prompt, system_instruction, temperature, max_tokens, key_fingerprint, api_key)
+    except UncachedResponse as e:
+        return e.response
+
+
+@st.cache_data(ttl=RESPONSE_CACHE_TTL, show_spinner=False)
+def cached_generate_batch(prompts, system_instruction, temperature, max_tokens, key_fingerprint, _api_key):
+    """Generate responses for several prompts with concurrent calls, serving identical prompt sets from the cache"""
+    responses = get_gemini_client(_api_key).generate_batch(list(prompts), temperature=temperature,
+                                                           max_tokens=max_tokens,
+                                                           system_instruction=system_instruction)
+    if EMPTY_RESPONSE in responses:
+        raise UncachedResponse(responses)
+    return responses
+
+
+def generate_cached_batch(prompts, system_instruction=None, temperature=0.7, max_tokens=300):
+    """Generate responses for several prompts with concurrent calls through the response cache"""
+    api_key = st.session_state.gemini_api_key
+    key_fingerprint = hashlib.sha1(api_key.encode()).hexdigest()[:8]
+    try:
+        return cached_generate_batch(tuple(prompts), system_instruction, temperature, max_tokens, key_fingerprint,
+                                     api_key)
+    except UncachedResponse as e:
+        return e.response
+
+
+@st.cache_resource(show_spinner=False)
+def get_streamed_answers():
+    """Get the shared store of streamed chat answers, keyed like the response cache, oldest first"""
+    return OrderedDict()
+
+
+def get_streamed_answer(cache_key):
+    """Get a streamed answer stored within the cache TTL, or None"""
+    with STREAMED_ANSWERS_LOCK:
+        entry = get_streamed_answers().get(cache_key)
+    if entry and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def store_streamed_answer(cache_key, response):
+    """Store a finished streamed answer, evicting expired and then the oldest entries"""
+    now = time.monotonic()
+    with STREAMED_ANSWERS_LOCK:
+        answers = get_streamed_answers()
+        answers[cache_key] = (now, response)
+        answers.move_to_end(cache_key)
+        # Entries are kept in storage order, so expired and overflow entries are always at the front
+        while answers and (len(answers) > STREAMED_ANSWERS_MAX or
+                           now - next(iter(answers.values()))[0] >= RESPONSE_CACHE_TTL):
+            answers.popitem(last=False)
+
+
+def queue_prompt(prompt):
+    """Queue a quick action prompt to be sent with the next Ask"""
+    if 'pending_prompts' not in st.session_state:
+        st.session_state.pending_prompts = []
+    if prompt not in st.session_state.pending_prompts:
+        st.session_state.pending_prompts.append(prompt)
 
 
 def render():
@@ -19,130 +130,167 @@ def render():
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        if st.button("🚀 Hackathon Strategy", use_container_width=True):
-            st.session_state['ai_query'] = "Hackathon strategy tips"
+        st.button("🚀 Hackathon Strategy", use_container_width=True,
+                  on_click=queue_prompt, args=("Hackathon strategy tips",))
 
-        if st.button("💻 Technical Guidance", use_container_width=True):
-            st.session_state['ai_query'] = "Technical architecture guidance"
+        st.button("💻 Technical Guidance", use_container_width=True,
+                  on_click=queue_prompt, args=("Technical architecture guidance",))
 
-        if st.button("🎯 Project Ideas", use_container_width=True):
-            st.session_state['ai_query'] = "3 hackathon project ideas"
+        st.button("🎯 Project Ideas", use_container_width=True,
+                  on_click=queue_prompt, args=("3 hackathon project ideas",))
 
     with col2:
-        if st.button("📈 Industry Insights", use_container_width=True):
-            st.session_state['ai_query'] = "Current tech trends"
+        st.button("📈 Industry Insights", use_container_width=True,
+                  on_click=queue_prompt, args=("Current tech trends",))
 
-        if st.button("🎤 Presentation Tips", use_container_width=True):
-            st.session_state['ai_query'] = "Presentation tips"
+        st.button("🎤 Presentation Tips", use_container_width=True,
+                  on_click=queue_prompt, args=("Presentation tips",))
 
-        if st.button("🔍 Code Review Help", use_container_width=True):
-            st.session_state['ai_query'] = "Code review tips"
+        st.button("🔍 Code Review Help", use_container_width=True,
+                  on_click=queue_prompt, args=("Code review tips",))
 
     with col3:
-        if st.button("🚀 Startup Advice", use_container_width=True):
-            st.session_state['ai_query'] = "Startup advice"
+        st.button("🚀 Startup Advice", use_container_width=True,
+                  on_click=queue_prompt, args=("Startup advice",))
 
-        if st.button("💼 Career Guidance", use_container_width=True):
-            st.session_state['ai_query'] = "Career advice"
+        st.button("💼 Career Guidance", use_container_width=True,
+                  on_click=queue_prompt, args=("Career advice",))
 
-        if st.button("🌟 Tech Trends", use_container_width=True):
-            st.session_state['ai_query'] = "Hot tech trends"
+        st.button("🌟 Tech Trends", use_container_width=True,
+                  on_click=queue_prompt, args=("Hot tech trends",))
 
     st.markdown("---")
 
     # Chat interface
     st.subheader("💬 AI Chat")
 
+    render_chat()
+
+    # Specialized AI features
+    st.markdown("---")
+    st.subheader("🎯 Quick Tools")
+
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["🏆 Team Analysis", "💡 Ideas", "📊 Trends", "🎤 Presentation"])
+
+    with tab1:
+        render_team_insights()
+
+    with tab2:
+        render_idea_generator()
+
+    with tab3:
+        render_trend_analysis()
+
+    with tab4:
+        render_presentation_coach()
+
+
+@st.fragment
+def render_chat():
+    """Render the chat history and input box"""
     # Initialize chat history
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
 
     # Display chat history
     for message in st.session_state.chat_history:
-        if message['role'] == 'user':
-            st.markdown(f"**You:** {message['content']}")
-        else:
-            st.markdown(f"**AI:** {message['content']}")
-        st.markdown("---")
+        with st.chat_message(message['role']):
+            st.markdown(message['content'])
+
+    # Quick actions waiting for the next Ask
+    pending_prompts = st.session_state.get('pending_prompts', [])
+    if pending_prompts:
+        st.caption(f"⚡ Queued: {', '.join(pending_prompts)}")
 
     # User input
     user_query = st.text_area(
         "Ask me anything about tech, hackathons, or development:",
-        value=st.session_state.get('ai_query', ''),
         height=80,
         key='user_input'
     )
 
-    # Clear the session state query after using it
-    if 'ai_query' in st.session_state:
-        del st.session_state['ai_query']
-
     col1, col2, col3 = st.columns([1, 1, 2])
 
     with col1:
-        if st.button("🚀 Ask", type="primary"):
-            if user_query.strip():
-                process_ai_query(user_query)
-            else:
-                st.warning("Please enter a question!")
+        ask_clicked = st.button("🚀 Ask", type="primary")
 
     with col2:
         if st.button("🗑️ Clear"):
             st.session_state.chat_history = []
-            st.rerun()
-
-    # Specialized AI features
-    st.markdown("---")
-    st.subheader("🎯 Quick Tools")
+            st.session_state.pending_prompts = []
+            st.rerun(scope="fragment")
 
-    tab1, tab2, tab3, tab4 = st.tabs(
-        ["🏆 Team Analysis", "💡 Ideas", "📊 Trends", "🎤 Presentation"])
-
-    with tab1:
-        render_team_insights()
+    if ask_clicked:
+        queries = pending_prompts + ([user_query.strip()] if user_query.strip() else [])
+        if queries:
+            process_ai_queries(queries)
+        else:
+            st.warning("Please enter a question!")
 
-    with tab2:
-        render_idea_generator()
 
-    with tab3:
-        render_trend_analysis()
+def process_ai_queries(queries):
+    """Process user queries with concurrent calls and ultra-brief responses"""
+    try:
+        # Ultra-brief answers for fast responses; a lone question is streamed as it arrives
+        if len(queries) == 1:
+            responses = [stream_ai_response(queries[0])]
+        else:
+            with st.spinner("Thinking..."):
+                responses = generate_cached_batch(queries, CHAT_SYSTEM_PROMPT, temperature=0.5, max_tokens=80)
 
-    with tab4:
-        render_presentation_coach()
+        # Add to chat history
+        for query, response in zip(queries, responses):
+            st.session_state.chat_history.append({
+                'role': 'user',
+                'content': query
+            })
+            st.session_state.chat_history.append({
+                'role': 'assistant',
+                'content': response
+            })
+
+        st.session_state.pending_prompts = []
+        st.rerun(scope="fragment")
 
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
+        st.info("Check your API key and try again.")
 
-def process_ai_query(query):
-    """Process user query with ultra-brief responses"""
-    try:
-        client = GeminiClient(st.session_state.gemini_api_key)
 
-        # Ultra-brief prompt for fast responses
-        enhanced_prompt = f"""Answer in 1-2 sentences. Be direct.
+def stream_ai_response(query):
+    """Stream the answer to a single query into a chat bubble and return the full text"""
+    with st.chat_message('user'):
+        st.markdown(query)
 
-{query}
+    api_key = st.session_state.gemini_api_key
+    cache_key = (query, CHAT_SYSTEM_PROMPT, 0.5, 80, hashlib.sha1(api_key.encode()).hexdigest()[:8])
 
-Brief answer only:"""
+    with st.chat_message('assistant'):
+        placeholder = st.empty()
 
-        with st.spinner("Thinking..."):
-            response = client.generate_response(enhanced_prompt, temperature=0.5, max_tokens=80)
+        # A repeated question is answered from the cache instead of streaming it again
+        response = get_streamed_answer(cache_key)
+        if response is None:
+            response = ""
+            client = get_gemini_client(api_key)
+            for chunk in client.stream_response(query, temperature=0.5, max_tokens=80,
+                                                system_instruction=CHAT_SYSTEM_PROMPT):
+                response += chunk
+                # Plain text while streaming; markdown is rendered once at the end
+                placeholder.text(response)
 
-        # Add to chat history
-        st.session_state.chat_history.append({
-            'role': 'user',
-            'content': query
-        })
-        st.session_state.chat_history.append({
-            'role': 'assistant',
-            'content': response
-        })
+            # Empty answers are not stored, so asking again retries
+            if response:
+                store_streamed_answer(cache_key, response)
 
-        st.rerun()
+        response = response or EMPTY_RESPONSE
+        placeholder.markdown(response)
 
-    except Exception as e:
-        st.error(f"Error: {str(e)}")
-        st.info("Check your API key and try again.")
+    return response
 
 
+@st.fragment
 def render_team_insights():
     """Render team insights feature"""
     st.markdown("**🏆 Get AI insights about teams**")
@@ -159,16 +307,13 @@ def render_team_insights():
 
     if st.button("🔍 Analyze", key="analyze_team_btn"):
         try:
-            client = GeminiClient(st.session_state.gemini_api_key)
             team_data = st.session_state.teams[selected_team]
 
             # Ultra-brief prompt
-            team_prompt = f"""Team: {len(team_data['members'])} members, {', '.join([m['role_preference'] for m in team_data['members']])}.
-
-Strengths and best project type:"""
+            team_prompt = f"""Team: {len(team_data['members'])} members, {', '.join([m['role_preference'] for m in team_data['members']])}."""
 
             with st.spinner("Analyzing..."):
-                insights = client.generate_response(team_prompt, max_tokens=60)
+                insights = generate_cached_response(team_prompt, TEAM_SYSTEM_PROMPT, max_tokens=60)
 
             st.markdown("### 🎯 Analysis")
             st.markdown(insights)
@@ -177,6 +322,7 @@ Strengths and best project type:"""
             st.error(f"Error: {str(e)}")
 
 
+@st.fragment
 def render_idea_generator():
     """Render idea generator feature"""
     st.markdown("**💡 Generate project ideas**")
@@ -184,30 +330,18 @@ def render_idea_generator():
     col1, col2 = st.columns(2)
 
     with col1:
-        interests = st.multiselect(
-            "Interests:",
-            ["AI/ML", "Web Dev", "Mobile", "Blockchain", "IoT",
-             "Healthcare", "Fintech", "Gaming", "AR/VR"]
-        )
+        interests = st.multiselect("Interests:", INTEREST_OPTIONS)
 
     with col2:
-        skills = st.multiselect(
-            "Skills:",
-            ["Python", "JavaScript", "React", "Node.js", "Flutter",
-             "TensorFlow", "Cloud", "Databases", "UI/UX"]
-        )
+        skills = st.multiselect("Skills:", SKILL_OPTIONS)
 
     if st.button("✨ Generate", key="generate_ideas_btn"):
         try:
-            client = GeminiClient(st.session_state.gemini_api_key)
-
             # Ultra-brief prompt for ideas
-            ideas_prompt = f"""3 hackathon ideas: {', '.join(interests[:2]) if interests else 'tech'}.
-
-Quick format: Title - short description."""
+            ideas_prompt = f"""Areas: {', '.join(interests[:2]) if interests else 'tech'}."""
 
             with st.spinner("Generating..."):
-                ideas = client.generate_response(ideas_prompt, max_tokens=80)
+                ideas = generate_cached_response(ideas_prompt, IDEAS_SYSTEM_PROMPT, max_tokens=80)
 
             st.markdown("### 🚀 Ideas")
             st.markdown(ideas)
@@ -216,19 +350,18 @@ Quick format: Title - short description."""
             st.error(f"Error: {str(e)}")
 
 
+@st.fragment
 def render_trend_analysis():
     """Render trend analysis feature"""
     st.markdown("**📊 Current tech trends**")
 
     if st.button("📈 Get Trends", key="analyze_trends_btn"):
         try:
-            client = GeminiClient(st.session_state.gemini_api_key)
-
             # Ultra-brief prompt for trends
             trends_prompt = """Top 3 hackathon tech trends:"""
 
             with st.spinner("Analyzing..."):
-                analysis = client.generate_response(trends_prompt, max_tokens=60)
+                analysis = generate_cached_response(trends_prompt, max_tokens=60)
 
             st.markdown("### 📊 Trends")
             st.markdown(analysis)
@@ -237,6 +370,7 @@ def render_trend_analysis():
             st.error(f"Error: {str(e)}")
 
 
+@st.fragment
 def render_presentation_coach():
     """Render presentation coaching feature"""
     st.markdown("**🎤 Presentation tips**")
@@ -249,13 +383,11 @@ def render_presentation_coach():
 
     if st.button("🎯 Get Tips", key="presentation_tips_btn"):
         try:
-            client = GeminiClient(st.session_state.gemini_api_key)
-
             # Ultra-brief prompt for tips
-            tips_prompt = f"""5 hackathon presentation tips for {project_description[:50] if project_description else 'project'}:"""
+            tips_prompt = f"""Project: {project_description[:50] if project_description else 'project'}"""
 
             with st.spinner("Getting tips..."):
-                tips = client.generate_response(tips_prompt, max_tokens=80)
+                tips = generate_cached_response(tips_prompt, TIPS_SYSTEM_PROMPT, max_tokens=80)
 
             st.markdown("### 🎤 Tips")
             st.markdown(tips)
@@ -1,13 +1,105 @@
 import streamlit as st
 import pandas as pd
 import logging
-from datetime import datetime
+import math
+import re
+from datetime import date, datetime
+from functools import lru_cache
 from utils.scraper import HackathonScraper
-from utils.filters import HackathonFilter
-from utils.data_exporter import DataExporter
 
 logger = logging.getLogger(__name__)
 
+PARSED_DATE_COLUMNS = {'date': '_parsed_date', 'registration_deadline': '_parsed_reg_deadline'}
+SEARCH_FIELDS = ('title', 'description', 'tags', 'location')
+CATEGORY_COLUMNS = ('source', 'location_type', 'difficulty')
+RESULTS_PAGE_SIZE = 100
+ISO_DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+SLASH_DATE_PATTERN = re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})')
+# Sort option -> (key column, ascending); the text keys are the lowercased search columns
+SORT_KEYS = {
+    "Date": ('date', True),
+    "Prize Amount": ('prize_amount', False),
+    "Title": ('_search_title', True),
+    "Location": ('_search_location', True),
+    "Registration Deadline": ('registration_deadline', True)
+}
+
+CONTINENT_COUNTRIES = {
+    "North America": ["usa", "canada", "mexico", "united states", "america"],
+    "Europe": ["uk", "germany", "france", "spain", "italy", "netherlands", "sweden", "norway"],
+    "Asia": ["india", "china", "japan", "korea", "singapore", "thailand", "indonesia"],
+    "Africa": ["south africa", "nigeria", "kenya", "egypt"],
+    "South America": ["brazil", "argentina", "chile", "colombia"],
+    "Oceania": ["australia", "new zealand"]
+}
+COUNTRY_TO_CONTINENT = {country: continent for continent, countries in CONTINENT_COUNTRIES.items()
+                        for country in countries}
+# Longest names first so e.g. "united states" wins over any shorter name it contains
+COUNTRY_PATTERN = re.compile('|'.join(re.escape(country) for country in
+                                      sorted(COUNTRY_TO_CONTINENT, key=len, reverse=True)))
+
+@st.cache_resource(show_spinner=False)
+def get_scraper():
+    """Get a shared hackathon scraper instance"""
+    return HackathonScraper()
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def cached_scrape_all():
+    """Scrape all sources, sharing the results across reruns and users for 30 minutes"""
+    return get_scraper().scrape_all()
+
+def hackathon_tags(hackathon):
+    """Get a hackathon's tags as a list, treating a plain string as a single tag"""
+    tags = hackathon.get('tags', [])
+    if isinstance(tags, str):
+        return [tags] if tags else []
+    return tags if isinstance(tags, list) else []
+
+def index_hackathons(hackathons):
+    """Collect the distinct sources and tags, plus a lowercase tag -> row index lookup"""
+    tag_rows = {}
+    for row, hackathon in enumerate(hackathons):
+        for tag in hackathon_tags(hackathon):
+            tag_rows.setdefault(tag.lower(), []).append(row)
+    
+    return {
+        'sources': tuple(sorted({h.get('source', '') for h in hackathons if h.get('source')})),
+        'tags': tuple(sorted({tag for h in hackathons for tag in hackathon_tags(h)})),
+        'tag_rows': tag_rows
+    }
+
+def get_hackathon_index():
+    """Get the source/tag index of the loaded hackathons, building it once per dataset"""
+    if st.session_state.get('hackathon_index') is None:
+        st.session_state.hackathon_index = index_hackathons(st.session_state.hackathons_data)
+    return st.session_state.hackathon_index
+
+@st.cache_data(show_spinner=False)
+def build_hackathons_df(hackathons):
+    """Build a columnar DataFrame of the hackathons with compact dtypes"""
+    df = pd.DataFrame(hackathons).convert_dtypes()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    # Keep prize amounts as one compact numeric column for the prize filters and sort
+    df['prize_amount'] = pd.to_numeric(number_column(df, 'prize_amount'), downcast='integer')
+    
+    # Lowercase the searchable text once per dataset instead of on every search
+    for col in SEARCH_FIELDS:
+        df[f'_search_{col}'] = text_column(df, col).str.lower()
+    
+    # Parse dates once per dataset; unparseable dates stay NaT and fall back to today at filter time
+    for col, parsed_col in PARSED_DATE_COLUMNS.items():
+        df[parsed_col] = pd.to_datetime(text_column(df, col).map(parse_date_string))
+    return df
+
+def get_hackathons_df():
+    """Get the DataFrame view of the loaded hackathons, building it once per dataset"""
+    if st.session_state.get('hackathons_df') is None:
+        st.session_state.hackathons_df = build_hackathons_df(st.session_state.hackathons_data)
+    return st.session_state.hackathons_df
+
 def render():
     st.header("🔍 Hackathon Discovery")
     st.markdown("Discover hackathons from around the world with powerful filtering and export capabilities.")
@@ -33,6 +125,8 @@ def render_data_refresh():
     with col2:
         if st.button("🔄 Refresh Data", type="primary"):
             refresh_hackathon_data()
+        if st.button("♻️ Force Refresh", help="Bypass the 30 minute cache and scrape all sources again"):
+            refresh_hackathon_data(force=True)
     
     # Display current data status
     if st.session_state.hackathons_data:
@@ -44,6 +138,7 @@ def render_data_refresh():
     else:
         st.warning("No hackathon data loaded. Click 'Refresh Data' to fetch hackathons.")
 
+@st.fragment
 def render_filters_and_search():
     st.subheader("🎯 Advanced Filter & Search")
     
@@ -51,107 +146,106 @@ def render_filters_and_search():
         st.warning("No data available. Please refresh hackathon data first.")
         return
     
-    # Quick stats
-    total_hackathons = len(st.session_state.hackathons_data)
-    filtered_count = len(getattr(st.session_state, 'filtered_hackathons', st.session_state.hackathons_data))
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Available", total_hackathons)
-    with col2:
-        st.metric("Currently Showing", filtered_count)
-    with col3:
-        if total_hackathons > 0:
-            percentage = (filtered_count / total_hackathons) * 100
-            st.metric("Filtered %", f"{percentage:.1f}%")
-    
-    st.markdown("---")
-    
-    # Enhanced filter controls with expandable sections
-    with st.expander("🔍 Text Search", expanded=True):
-        col1, col2 = st.columns(2)
-        with col1:
-            search_text = st.text_input("Search keywords", placeholder="AI, hackathon, web3...")
-        with col2:
-            search_in = st.multiselect("Search in fields", 
-                                     ["Title", "Description", "Tags", "Location"],
-                                     default=["Title", "Description"])
-    
-    with st.expander("📅 Date & Time Filters"):
+    hackathon_index = get_hackathon_index()
+    available_sources, available_tags = hackathon_index['sources'], hackathon_index['tags']
+    
+    # Quick stats are filled in after the form so they count the filters applied in this run
+    stats_container = st.container()
+    
+    # Filter widgets live in a form so edits only rerun the app on submit
+    with st.form("hackathon_filters"):
+        # Enhanced filter controls with expandable sections
+        with st.expander("🔍 Text Search", expanded=True):
+            col1, col2 = st.columns(2)
+            with col1:
+                search_text = st.text_input("Search keywords", placeholder="AI, hackathon, web3...", key="flt_search_text")
+            with col2:
+                search_in = st.multiselect("Search in fields", 
+                                         ["Title", "Description", "Tags", "Location"],
+                                         default=["Title", "Description"], key="flt_search_in")
+    
+        with st.expander("📅 Date & Time Filters"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                start_date = st.date_input("Start date", value=None, key="flt_start_date")
+            with col2:
+                end_date = st.date_input("End date", value=None, key="flt_end_date")
+            with col3:
+                time_filter = st.selectbox("Time Range", 
+                                         ["All", "This Week", "This Month", "Next 3 Months", "Next 6 Months"],
+                                         key="flt_time_filter")
+    
+        with st.expander("📍 Location Filters"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                location_type = st.selectbox("Event Type", ["All", "Online", "In-person", "Hybrid"], key="flt_location_type")
+            with col2:
+                location_name = st.text_input("City/Country", placeholder="San Francisco, USA...", key="flt_location_name")
+            with col3:
+                continent = st.selectbox("Continent", 
+                                       ["All", "North America", "Europe", "Asia", "Africa", "South America", "Oceania"],
+                                       key="flt_continent")
+    
+        with st.expander("🏷️ Category & Theme Filters"):
+            col1, col2 = st.columns(2)
+            with col1:
+                category_options = ["AI/ML", "Web Development", "Mobile", "Blockchain", "IoT", "Gaming", 
+                                    "FinTech", "HealthTech", "EdTech", "Sustainability", "Open Source"]
+                categories = st.multiselect("Categories", 
+                                          category_options + [tag for tag in available_tags if tag not in category_options],
+                                          key="flt_categories")
+            with col2:
+                difficulty = st.selectbox("Difficulty Level", ["All", "Beginner", "Intermediate", "Advanced", "Expert"],
+                                          key="flt_difficulty")
+    
+        with st.expander("💰 Prize & Competition Filters"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                min_prize = st.number_input("Min Prize ($)", min_value=0, value=0, step=100, key="flt_min_prize")
+            with col2:
+                max_prize = st.number_input("Max Prize ($)", min_value=0, value=100000, step=1000, key="flt_max_prize")
+            with col3:
+                has_prizes = st.checkbox("Only events with prizes", value=False, key="flt_has_prizes")
+    
+        with st.expander("🌐 Source & Organization"):
+            col1, col2 = st.columns(2)
+            with col1:
+                sources = st.multiselect("Data Sources", available_sources, key="flt_sources")
+            with col2:
+                organizers = st.text_input("Organizer", placeholder="Company or organization...", key="flt_organizers")
+    
+        # Additional options
         col1, col2, col3 = st.columns(3)
         with col1:
-            start_date = st.date_input("Start date", value=None)
+            upcoming_only = st.checkbox("Upcoming events only", value=True, key="flt_upcoming_only")
         with col2:
-            end_date = st.date_input("End date", value=None)
+            registration_open = st.checkbox("Registration still open", value=False, key="flt_registration_open")
         with col3:
-            time_filter = st.selectbox("Time Range", 
-                                     ["All", "This Week", "This Month", "Next 3 Months", "Next 6 Months"])
-    
-    with st.expander("📍 Location Filters"):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            location_type = st.selectbox("Event Type", ["All", "Online", "In-person", "Hybrid"])
-        with col2:
-            location_name = st.text_input("City/Country", placeholder="San Francisco, USA...")
-        with col3:
-            continent = st.selectbox("Continent", 
-                                   ["All", "North America", "Europe", "Asia", "Africa", "South America", "Oceania"])
-    
-    with st.expander("🏷️ Category & Theme Filters"):
-        col1, col2 = st.columns(2)
-        with col1:
-            categories = st.multiselect("Categories", 
-                                      ["AI/ML", "Web Development", "Mobile", "Blockchain", "IoT", "Gaming", 
-                                       "FinTech", "HealthTech", "EdTech", "Sustainability", "Open Source"])
-        with col2:
-            difficulty = st.selectbox("Difficulty Level", ["All", "Beginner", "Intermediate", "Advanced", "Expert"])
-    
-    with st.expander("💰 Prize & Competition Filters"):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            min_prize = st.number_input("Min Prize ($)", min_value=0, value=0, step=100)
-        with col2:
-            max_prize = st.number_input("Max Prize ($)", min_value=0, value=100000, step=1000)
-        with col3:
-            has_prizes = st.checkbox("Only events with prizes", value=False)
+            sort_by = st.selectbox("Sort by", ["Date", "Prize Amount", "Title", "Location", "Registration Deadline"],
+                                   key="flt_sort_by")
+        
+        applied = st.form_submit_button("🎯 Apply Filters", type="primary", use_container_width=True)
     
-    with st.expander("🌐 Source & Organization"):
-        col1, col2 = st.columns(2)
-        with col1:
-            sources = st.multiselect("Data Sources", 
-                                   ["Devpost", "Hackathon.io", "HackerEarth", "MLH", "Others"])
-        with col2:
-            organizers = st.text_input("Organizer", placeholder="Company or organization...")
+    if applied:
+        apply_enhanced_filters(search_text, search_in, start_date, end_date, time_filter,
+                             location_type, location_name, continent, categories, difficulty,
+                             min_prize, max_prize, has_prizes, sources, organizers,
+                             upcoming_only, registration_open, sort_by)
     
-    # Additional options
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        upcoming_only = st.checkbox("Upcoming events only", value=True)
-    with col2:
-        registration_open = st.checkbox("Registration still open", value=False)
-    with col3:
-        sort_by = st.selectbox("Sort by", ["Date", "Prize Amount", "Title", "Location", "Registration Deadline"])
+    render_filter_stats(stats_container)
     
     # Filter action buttons
     st.markdown("---")
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("🎯 Apply Filters", type="primary", use_container_width=True):
-            apply_enhanced_filters(search_text, search_in, start_date, end_date, time_filter,
-                                 location_type, location_name, continent, categories, difficulty,
-                                 min_prize, max_prize, has_prizes, sources, organizers,
-                                 upcoming_only, registration_open, sort_by)
+        st.button("🔄 Reset Filters", use_container_width=True, on_click=reset_filters)
     
     with col2:
-        if st.button("🔄 Reset Filters", use_container_width=True):
-            reset_filters()
-    
-    with col3:
         if st.button("⭐ Save Filter Preset", use_container_width=True):
             save_filter_preset()
     
-    with col4:
+    with col3:
         saved_presets = get_filter_presets()
         if saved_presets:
             selected_preset = st.selectbox("Load Preset", [""] + list(saved_presets.keys()))
@@ -161,6 +255,7 @@ def render_filters_and_search():
     # Display filtered results
     display_hackathon_results()
 
+@st.fragment
 def render_analytics():
     st.subheader("📊 Hackathon Analytics")
     
@@ -168,29 +263,55 @@ def render_analytics():
         st.warning("No data available for analytics.")
         return
     
-    df = pd.DataFrame(st.session_state.hackathons_data)
+    stats = get_hackathon_stats()
     
     # Basic stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Hackathons", len(df))
+        st.metric("Total Hackathons", stats['total'])
     with col2:
-        online_count = len(df[df.get('location_type', '') == 'Online']) if 'location_type' in df.columns else 0
-        st.metric("Online Events", int(online_count))
+        st.metric("Online Events", stats['online'])
     with col3:
         # Count upcoming events (simplified)
-        sources_count = int(df['source'].nunique()) if 'source' in df.columns else 0
-        st.metric("Total Sources", sources_count)
+        st.metric("Total Sources", stats['sources'])
     with col4:
-        locations_count = int(df['location'].nunique()) if 'location' in df.columns else 0
-        st.metric("Unique Locations", locations_count)
+        st.metric("Unique Locations", stats['locations'])
+
+def hackathon_stats(df):
+    """Count the totals shown in the analytics tab"""
+    return {
+        'total': len(df),
+        'online': int((df['location_type'] == 'Online').sum()) if 'location_type' in df.columns else 0,
+        'sources': int(df['source'].nunique()) if 'source' in df.columns else 0,
+        'locations': int(df['location'].nunique()) if 'location' in df.columns else 0
+    }
 
-def refresh_hackathon_data():
+def get_hackathon_stats():
+    """Get the analytics totals of the loaded hackathons, counting them once per dataset"""
+    if st.session_state.get('hackathon_stats') is None:
+        st.session_state.hackathon_stats = hackathon_stats(get_hackathons_df())
+    return st.session_state.hackathon_stats
+
+def refresh_hackathon_data(force=False):
     """Refresh hackathon data from sources"""
     with st.spinner("Fetching latest hackathons..."):
         try:
-            scraper = HackathonScraper()
-            st.session_state.hackathons_data = scraper.scrape_all()
+            if force:
+                cached_scrape_all.clear()
+            hackathons = cached_scrape_all()
+            if not hackathons:
+                # Every source failed or was empty; don't keep that cached, so the next refresh retries
+                cached_scrape_all.clear()
+                st.warning("⚠️ Couldn't fetch any hackathons. Check your connection and try again.")
+                return
+
+            st.session_state.hackathons_data = hackathons
+            st.session_state.hackathons_df = build_hackathons_df(st.session_state.hackathons_data)
+            st.session_state.hackathon_index = index_hackathons(st.session_state.hackathons_data)
+            st.session_state.hackathon_stats = None
+            # Filter results point into the previous dataset, so drop them
+            st.session_state.pop('filtered_hackathons', None)
+            st.session_state.pop('filtered_rows', None)
             st.session_state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             st.success(f"✅ Fetched {len(st.session_state.hackathons_data)} hackathons successfully!")
         except Exception as e:
@@ -203,49 +324,53 @@ def apply_enhanced_filters(search_text, search_in, start_date, end_date, time_fi
                          upcoming_only, registration_open, sort_by):
     """Apply enhanced filters to hackathon data"""
     try:
-        # Start with all data
-        filtered_data = st.session_state.hackathons_data.copy()
+        # Every filter ANDs its predicate into this one mask in place, so the rows are
+        # never copied between stages and no per-filter result is kept around
+        df = get_hackathons_df()
+        mask = pd.Series(True, index=df.index)
         
         # Apply text search
         if search_text and search_in:
-            filtered_data = filter_by_text_search(filtered_data, search_text, search_in)
+            filter_by_text_search(df, mask, search_text, search_in)
         
         # Apply date filters
         if start_date or end_date or time_filter != "All":
-            filtered_data = filter_by_date_range(filtered_data, start_date, end_date, time_filter)
+            filter_by_date_range(df, mask, start_date, end_date, time_filter)
         
         # Apply location filters
         if location_type != "All" or location_name or continent != "All":
-            filtered_data = filter_by_location(filtered_data, location_type, location_name, continent)
+            filter_by_location(df, mask, location_type, location_name, continent)
         
         # Apply category filters
         if categories or difficulty != "All":
-            filtered_data = filter_by_categories(filtered_data, categories, difficulty)
+            filter_by_categories(df, mask, categories, difficulty, get_hackathon_index())
         
         # Apply prize filters
         if min_prize > 0 or max_prize < 100000 or has_prizes:
-            filtered_data = filter_by_prizes(filtered_data, min_prize, max_prize, has_prizes)
+            filter_by_prizes(df, mask, min_prize, max_prize, has_prizes)
         
         # Apply source filters
         if sources or organizers:
-            filtered_data = filter_by_source_org(filtered_data, sources, organizers)
+            filter_by_source_org(df, mask, sources, organizers)
         
         # Apply additional filters
         if upcoming_only:
-            filtered_data = filter_upcoming_events(filtered_data)
+            filter_upcoming_events(df, mask)
         
         if registration_open:
-            filtered_data = filter_registration_open(filtered_data)
+            filter_registration_open(df, mask)
         
         # Sort results
-        if sort_by != "Date":
-            filtered_data = sort_results(filtered_data, sort_by)
+        rows = df.index[mask] if sort_by == "Date" else sort_results(df, mask, sort_by)
         
+        hackathons = st.session_state.hackathons_data
+        filtered_data = [hackathons[row] for row in rows]
         st.session_state.filtered_hackathons = filtered_data
+        st.session_state.filtered_rows = list(rows)
         
         # Show success message with count
         count = len(filtered_data)
-        total = len(st.session_state.hackathons_data)
+        total = len(hackathons)
         st.success(f"✅ Found {count} hackathons out of {total} total events")
         
         # Show filter summary
@@ -256,193 +381,234 @@ def apply_enhanced_filters(search_text, search_in, start_date, end_date, time_fi
         st.error(f"❌ Error applying filters: {str(e)}")
         logger.error(f"Error filtering hackathons: {e}")
 
-def filter_by_text_search(data, search_text, search_fields):
+def text_column(df, name):
+    """Get a column as strings, with missing columns and values as empty strings"""
+    if name not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[name].astype(object).fillna('').astype(str)
+
+def number_column(df, name):
+    """Get a column as numbers, with missing columns and values as zero"""
+    if name not in df.columns:
+        return pd.Series(0, index=df.index)
+    return pd.to_numeric(df[name], errors='coerce').fillna(0)
+
+def date_column(df, name):
+    """Get the pre-parsed dates of a column, with missing or unparseable dates as today"""
+    return df[PARSED_DATE_COLUMNS[name]].fillna(pd.Timestamp(datetime.now().date()))
+
+def category_mask(df, name, matches):
+    """Match a categorical column by testing its few categories instead of every row"""
+    if name not in df.columns:
+        return pd.Series(False, index=df.index)
+    column = df[name]
+    codes = [code for code, category in enumerate(column.cat.categories) if matches(str(category))]
+    return column.cat.codes.isin(codes)
+
+def contains_any(text, needles):
+    """Check each string in a Series for any of the given substrings"""
+    return text.str.contains('|'.join(re.escape(needle) for needle in needles), regex=True)
+
+@lru_cache(maxsize=256)
+def search_pattern(search_text):
+    """Compile one regex matching any of the comma-separated keywords of a search"""
+    keywords = [keyword.strip().lower() for keyword in search_text.split(',') if keyword.strip()]
+    if not keywords:
+        return None
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+def filter_by_text_search(df, mask, search_text, search_fields):
     """Filter data by text search in specified fields"""
     if not search_text:
-        return data
+        return mask
     
-    search_lower = search_text.lower()
-    filtered = []
+    pattern = search_pattern(search_text)
+    if pattern is None:
+        return mask
     
-    for item in data:
-        found = False
-        for field in search_fields:
-            field_key = field.lower()
-            if field_key in item and search_lower in str(item[field_key]).lower():
-                found = True
-                break
-        if found:
-            filtered.append(item)
+    matches = pd.Series(False, index=df.index)
+    for field in search_fields:
+        field_key = field.lower()
+        if field_key in df.columns:
+            matches |= df[f'_search_{field_key}'].str.contains(pattern)
     
-    return filtered
+    mask &= matches
+    return mask
 
-def filter_by_date_range(data, start_date, end_date, time_filter):
+def filter_by_date_range(df, mask, start_date, end_date, time_filter):
     """Filter data by date range"""
-    from datetime import datetime, timedelta
+    from datetime import timedelta
     
-    filtered = data.copy()
-    today = datetime.now().date()
+    today = pd.Timestamp(datetime.now().date())
+    # Collapse all the bounds into one window so the dates are compared in a single pass
+    earliest, latest = pd.Timestamp.min, pd.Timestamp.max
     
     # Apply time filter shortcuts
-    if time_filter == "This Week":
-        end_filter = today + timedelta(days=7)
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) <= end_filter]
-    elif time_filter == "This Month":
-        end_filter = today + timedelta(days=30)
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) <= end_filter]
-    elif time_filter == "Next 3 Months":
-        end_filter = today + timedelta(days=90)
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) <= end_filter]
-    elif time_filter == "Next 6 Months":
-        end_filter = today + timedelta(days=180)
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) <= end_filter]
+    time_filter_days = {"This Week": 7, "This Month": 30, "Next 3 Months": 90, "Next 6 Months": 180}
+    if time_filter in time_filter_days:
+        latest = today + timedelta(days=time_filter_days[time_filter])
     
     # Apply custom date range
     if start_date:
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) >= start_date]
+        earliest = pd.Timestamp(start_date)
     if end_date:
-        filtered = [item for item in filtered if parse_event_date(item.get('date')) <= end_date]
+        latest = min(latest, pd.Timestamp(end_date))
     
-    return filtered
+    mask &= date_column(df, 'date').between(earliest, latest)
+    return mask
 
-def filter_by_location(data, location_type, location_name, continent):
+def filter_by_location(df, mask, location_type, location_name, continent):
     """Filter data by location criteria"""
-    filtered = data.copy()
-    
     if location_type != "All":
-        filtered = [item for item in filtered if item.get('location_type', '').lower() == location_type.lower()]
+        mask &= category_mask(df, 'location_type', lambda category: category.lower() == location_type.lower())
     
     if location_name:
-        location_lower = location_name.lower()
-        filtered = [item for item in filtered if location_lower in item.get('location', '').lower()]
+        mask &= df['_search_location'].str.contains(location_name.lower(), regex=False)
     
     if continent != "All":
         # This would need continent mapping logic
-        filtered = filter_by_continent(filtered, continent)
+        mask &= filter_by_continent(df, continent)
     
-    return filtered
+    return mask
 
-def filter_by_categories(data, categories, difficulty):
+def filter_by_categories(df, mask, categories, difficulty, hackathon_index):
     """Filter data by categories and difficulty"""
-    filtered = data.copy()
     
     if categories:
-        category_filtered = []
-        for item in filtered:
-            item_categories = item.get('categories', []) or item.get('tags', [])
-            if any(cat in str(item_categories).lower() for cat in [c.lower() for c in categories]):
-                category_filtered.append(item)
-        filtered = category_filtered
+        categories_lower = [c.lower() for c in categories]
+        # Resolve tag matches once per distinct tag instead of once per hackathon
+        tag_matched_rows = {row for tag, rows in hackathon_index['tag_rows'].items()
+                            if any(cat in tag for cat in categories_lower) for row in rows}
+        category_matches = pd.Series(df.index.isin(tag_matched_rows), index=df.index)
+        
+        # Hackathons with their own categories are matched on those instead of their tags
+        if 'categories' in df.columns:
+            has_categories = df['categories'].map(lambda value: isinstance(value, (list, str)) and len(value) > 0)
+            in_categories = contains_any(text_column(df, 'categories').str.lower(), categories_lower)
+            category_matches = in_categories.where(has_categories, category_matches)
+        mask &= category_matches
     
     if difficulty != "All":
         # Filter by difficulty if available in data
-        filtered = [item for item in filtered if item.get('difficulty', '').lower() == difficulty.lower()]
+        mask &= category_mask(df, 'difficulty', lambda category: category.lower() == difficulty.lower())
     
-    return filtered
+    return mask
 
-def filter_by_prizes(data, min_prize, max_prize, has_prizes):
+def filter_by_prizes(df, mask, min_prize, max_prize, has_prizes):
     """Filter data by prize criteria"""
-    filtered = data.copy()
+    prize_amounts = df['prize_amount']
     
     if has_prizes:
-        filtered = [item for item in filtered if item.get('prize_amount', 0) > 0]
-    
-    if min_prize > 0:
-        filtered = [item for item in filtered if item.get('prize_amount', 0) >= min_prize]
+        mask &= prize_amounts > 0
     
-    if max_prize < 100000:
-        filtered = [item for item in filtered if item.get('prize_amount', 0) <= max_prize]
+    # The max prize slider tops out at 100000, which means no upper limit
+    mask &= prize_amounts.between(min_prize, max_prize if max_prize < 100000 else float('inf'))
     
-    return filtered
+    return mask
 
-def filter_by_source_org(data, sources, organizers):
+def filter_by_source_org(df, mask, sources, organizers):
     """Filter data by source and organizer"""
-    filtered = data.copy()
-    
     if sources:
-        source_filtered = []
-        for item in filtered:
-            if item.get('source', '') in sources:
-                source_filtered.append(item)
-        filtered = source_filtered
+        source_set = frozenset(sources)
+        mask &= category_mask(df, 'source', lambda category: category in source_set)
     
     if organizers:
-        org_lower = organizers.lower()
-        filtered = [item for item in filtered if org_lower in item.get('organizer', '').lower()]
+        mask &= text_column(df, 'organizer').str.lower().str.contains(organizers.lower(), regex=False)
     
-    return filtered
+    return mask
 
-def filter_upcoming_events(data):
+def filter_upcoming_events(df, mask):
     """Filter to show only upcoming events"""
-    from datetime import datetime
-    today = datetime.now().date()
-    return [item for item in data if parse_event_date(item.get('date')) >= today]
+    mask &= date_column(df, 'date') >= pd.Timestamp(datetime.now().date())
+    return mask
 
-def filter_registration_open(data):
+def filter_registration_open(df, mask):
     """Filter to show only events with open registration"""
-    from datetime import datetime
-    today = datetime.now().date()
-    return [item for item in data if parse_event_date(item.get('registration_deadline')) >= today]
-
-def sort_results(data, sort_by):
-    """Sort results by specified criteria"""
-    if sort_by == "Prize Amount":
-        return sorted(data, key=lambda x: x.get('prize_amount', 0), reverse=True)
-    elif sort_by == "Title":
-        return sorted(data, key=lambda x: x.get('title', '').lower())
-    elif sort_by == "Location":
-        return sorted(data, key=lambda x: x.get('location', '').lower())
-    elif sort_by == "Registration Deadline":
-        return sorted(data, key=lambda x: parse_event_date(x.get('registration_deadline')))
-    else:  # Date
-        return sorted(data, key=lambda x: parse_event_date(x.get('date')))
-
-def parse_event_date(date_str):
-    """Parse event date string to date object"""
-    from datetime import datetime
-    if not date_str:
-        return datetime.now().date()
-    
-    try:
-        # Try different date formats
-        for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']:
+    mask &= date_column(df, 'registration_deadline') >= pd.Timestamp(datetime.now().date())
+    return mask
+
+def sort_results(df, mask, sort_by):
+    """Get the row labels of the matching rows in the order of the specified criteria"""
+    column, ascending = SORT_KEYS.get(sort_by, SORT_KEYS["Date"])
+    # Sort only the precomputed key column instead of copying every matching row
+    keys = date_column(df, column) if column in PARSED_DATE_COLUMNS else df[column]
+    return keys[mask].sort_values(ascending=ascending, kind='stable').index
+
+@lru_cache(maxsize=4096)
+def parse_date_string(date_str):
+    """Parse a date string in any supported format, or None if no format matches"""
+    # Memoized: scrapes repeat the same few date strings across rows and refreshes
+    # Fast paths for the common YYYY-MM-DD and DD/MM/YYYY shapes skip the strptime loop
+    if ISO_DATE_PATTERN.fullmatch(date_str):
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            return None
+    
+    match = SLASH_DATE_PATTERN.fullmatch(date_str)
+    if match:
+        first, second, year = (int(part) for part in match.groups())
+        # Day first, then month first, like the strptime formats below
+        for day, month in ((first, second), (second, first)):
             try:
-                return datetime.strptime(str(date_str), fmt).date()
+                return date(year, month, day)
             except ValueError:
                 continue
-        return datetime.now().date()
-    except:
-        return datetime.now().date()
+        return None
+    
+    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
 
-def filter_by_continent(data, continent):
+@lru_cache(maxsize=4096)
+def location_continents(location):
+    """Get the continents of the countries named in a lowercase location"""
+    return frozenset(COUNTRY_TO_CONTINENT[country] for country in COUNTRY_PATTERN.findall(location))
+
+def filter_by_continent(df, continent):
     """Filter data by continent (simplified mapping)"""
-    continent_countries = {
-        "North America": ["usa", "canada", "mexico", "united states", "america"],
-        "Europe": ["uk", "germany", "france", "spain", "italy", "netherlands", "sweden", "norway"],
-        "Asia": ["india", "china", "japan", "korea", "singapore", "thailand", "indonesia"],
-        "Africa": ["south africa", "nigeria", "kenya", "egypt"],
-        "South America": ["brazil", "argentina", "chile", "colombia"],
-        "Oceania": ["australia", "new zealand"]
-    }
+    if continent in CONTINENT_COUNTRIES:
+        return df['_search_location'].map(lambda location: continent in location_continents(location)).astype(bool)
     
-    if continent in continent_countries:
-        countries = continent_countries[continent]
-        return [item for item in data 
-                if any(country in item.get('location', '').lower() for country in countries)]
+    return pd.Series(True, index=df.index)
+
+def filtered_percentage(filtered_count, total_count):
+    """Format the share of hackathons left after filtering"""
+    return f"{(filtered_count / total_count) * 100:.1f}%" if total_count else "0.0%"
+
+def render_filter_stats(container):
+    """Show the total and currently shown hackathon counts"""
+    total_hackathons = len(st.session_state.hackathons_data)
+    filtered_count = len(st.session_state.get('filtered_rows', st.session_state.hackathons_data))
     
-    return data
+    with container:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Available", total_hackathons)
+        with col2:
+            st.metric("Currently Showing", filtered_count)
+        with col3:
+            st.metric("Filtered %", filtered_percentage(filtered_count, total_hackathons))
+        
+        st.markdown("---")
 
 def show_filter_summary(filtered_count, total_count):
     """Show summary of applied filters"""
-    percentage = (filtered_count / total_count) * 100
-    st.info(f"📊 Showing {percentage:.1f}% of available hackathons ({filtered_count} out of {total_count})")
+    percentage = filtered_percentage(filtered_count, total_count)
+    st.info(f"📊 Showing {percentage} of available hackathons ({filtered_count} out of {total_count})")
 
 def reset_filters():
     """Reset all filters to show all data"""
-    if 'filtered_hackathons' in st.session_state:
-        del st.session_state.filtered_hackathons
-    st.success("✅ All filters have been reset")
-    st.rerun()
+    # Runs as a button callback, so clearing the widget keys here lets the
+    # rerun the click already triggers draw every filter at its default
+    for key in [key for key in st.session_state if key.startswith('flt_')]:
+        del st.session_state[key]
+    st.session_state.pop('filtered_hackathons', None)
+    st.session_state.pop('filtered_rows', None)
+    st.toast("✅ All filters have been reset")
 
 def save_filter_preset():
     """Save current filter settings as a preset"""
@@ -490,55 +656,83 @@ def display_hackathon_results():
         if st.button("📥 Export Data"):
             export_data(data_to_show, export_format)
     
-    # Display results
+    # Display results, reusing the cached DataFrames instead of rebuilding one per rerun
     st.markdown("### 📋 Results")
-    df = pd.DataFrame(data_to_show)
-    st.dataframe(df, use_container_width=True)
-    
-    # Detailed view
-    if st.checkbox("Show detailed view"):
-        for i, hackathon in enumerate(data_to_show[:10]):  # Limit to first 10 for performance
-            with st.expander(f"{hackathon.get('title', f'Hackathon {i+1}')}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Source:** {hackathon.get('source', 'Unknown')}")
-                    st.write(f"**Location:** {hackathon.get('location', 'Not specified')}")
-                    st.write(f"**Date:** {hackathon.get('date', 'Not specified')}")
-                with col2:
-                    if hackathon.get('url'):
-                        st.markdown(f"[Visit Event]({hackathon['url']})")
-                    if hackathon.get('description'):
-                        st.write(f"**Description:** {hackathon['description']}")
+    df = get_hackathons_df()
+    if 'filtered_rows' in st.session_state:
+        df = df.loc[st.session_state.filtered_rows]
+    view_columns = [col for col in ['title', 'date', 'location', 'location_type', 'source', 'tags', 'prize', 'url']
+                    if col in df.columns]
+    
+    # Only send the current page to the browser; exports still cover every result
+    page_count = max(1, math.ceil(len(df) / RESULTS_PAGE_SIZE))
+    # The page lives only in session state; giving the widget a default as well makes Streamlit warn
+    st.session_state.setdefault('results_page', 1)
+    if st.session_state.results_page > page_count:
+        st.session_state.results_page = page_count
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, key='results_page',
+                               help=f"{len(df)} results, {RESULTS_PAGE_SIZE} per page")
+    else:
+        page = 1
+    start = (page - 1) * RESULTS_PAGE_SIZE
+    
+    event = st.dataframe(
+        df[view_columns].iloc[start:start + RESULTS_PAGE_SIZE],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'url': st.column_config.LinkColumn("URL"),
+            'tags': st.column_config.ListColumn("Tags"),
+        },
+        on_select="rerun",
+        selection_mode="single-row"
+    )
+    
+    # Detailed view of the selected row
+    selected_rows = event.selection.rows
+    if not selected_rows:
+        st.caption("Select a row to see the event details.")
+        return
+    
+    hackathon = data_to_show[start + selected_rows[0]]
+    st.markdown(f"#### {hackathon.get('title', 'Hackathon')}")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(f"**Source:** {hackathon.get('source', 'Unknown')}")
+        st.write(f"**Location:** {hackathon.get('location', 'Not specified')}")
+        st.write(f"**Date:** {hackathon.get('date', 'Not specified')}")
+    with col2:
+        if hackathon.get('url'):
+            st.markdown(f"[Visit Event]({hackathon['url']})")
+        if hackathon.get('description'):
+            st.write(f"**Description:** {hackathon['description']}")
 
 def export_data(data, format_type):
     """Export data in specified format"""
     try:
+        from utils.data_exporter import DataExporter
         exporter = DataExporter()
-        filepath = None
         
+        # Serialize straight to bytes for the download instead of writing and re-reading a file
         if format_type == "csv":
-            filepath = exporter.export_to_csv(data)
+            payload, extension, mime = exporter.to_csv_bytes(data), "csv", "text/csv"
         elif format_type == "json":
-            filepath = exporter.export_to_json(data)
+            payload, extension, mime = exporter.to_json_bytes(data), "json", "application/json"
         elif format_type == "excel":
-            filepath = exporter.export_to_excel(data)
-        
-        if filepath:
-            st.success(f"✅ Data exported to {filepath}")
-            
-            # Provide download link
-            try:
-                with open(filepath, 'rb') as f:
-                    st.download_button(
-                        label=f"Download {format_type.upper()} file",
-                        data=f.read(),
-                        file_name=filepath.split('/')[-1],
-                        mime=f"application/{format_type}"
-                    )
-            except FileNotFoundError:
-                st.error("Export file not found. Please try again.")
+            payload, extension, mime = (exporter.to_excel_bytes(data), "xlsx",
+                                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
         else:
             st.error("Failed to create export file.")
+            return
+        
+        st.success(f"✅ Exported {len(data)} hackathons")
+        st.download_button(
+            label=f"Download {format_type.upper()} file",
+            data=payload,
+            file_name=f"hackathons_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+            mime=mime
+        )
             
     except Exception as e:
         st.error(f"❌ Error exporting data: {str(e)}")
@@ -2,7 +2,7 @@ author="Vatsal Varshney"
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import plotly.express as px
+from utils.charts import build_pie_chart, build_bar_chart
 
 
 def render():
@@ -248,15 +248,13 @@ def render_ideas_analytics():
     with col1:
         # Category distribution
         category_counts = df['category'].value_counts()
-        fig_cat = px.pie(values=category_counts.values, names=category_counts.index,
-                         title="Ideas by Category")
+        fig_cat = build_pie_chart(category_counts, "Ideas by Category")
         st.plotly_chart(fig_cat, use_container_width=True)
 
     with col2:
         # Difficulty distribution
         difficulty_counts = df['difficulty'].value_counts()
-        fig_diff = px.bar(x=difficulty_counts.index, y=difficulty_counts.values,
-                          title="Ideas by Difficulty Level")
+        fig_diff = build_bar_chart(difficulty_counts, "Ideas by Difficulty Level")
         st.plotly_chart(fig_diff, use_container_width=True)
 
     # Top ideas
@@ -272,8 +270,7 @@ def render_ideas_analytics():
 
     if all_skills:
         skills_counts = pd.Series(all_skills).value_counts().head(10)
-        fig_skills = px.bar(x=skills_counts.values, y=skills_counts.index,
-                            orientation='h', title="Most Requested Skills")
+        fig_skills = build_bar_chart(skills_counts, "Most Requested Skills", horizontal=True)
         st.plotly_chart(fig_skills, use_container_width=True)
 
 
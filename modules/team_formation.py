@@ -2,10 +2,40 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from collections import Counter
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.team_matcher import TeamMatcher
-from utils.gemini_client import GeminiClient
+from utils.team_matcher import TeamMatcher, EXPERIENCE_SCORES
+from utils.gemini_client import get_gemini_client
+from utils.charts import build_pie_chart, build_bar_chart
+
+PARTICIPANT_SEARCH_FIELDS = ('name', 'role_preference', 'bio', 'programming_langs', 'interests')
+
+
+def get_participants_df():
+    """Get the DataFrame view of the registered participants, building it once per registration"""
+    if st.session_state.get('participants_df') is None:
+        df = pd.DataFrame(st.session_state.participants)
+        # One lowercase search blob per participant, so a search is a single pass over one column
+        search_columns = [df[col].fillna('').astype(str).str.lower()
+                          for col in PARTICIPANT_SEARCH_FIELDS if col in df.columns]
+        df['_search_text'] = pd.concat(search_columns, axis=1).agg('\n'.join, axis=1) if search_columns else ''
+        st.session_state.participants_df = df
+    return st.session_state.participants_df
+
+
+def get_team_matcher(weight_skills, weight_experience, weight_interests):
+    """Get a team matcher for the registered participants, preprocessing them once per registration"""
+    weights = (weight_skills, weight_experience, weight_interests)
+    if st.session_state.get('team_matcher') is None or st.session_state.get('team_matcher_weights') != weights:
+        st.session_state.team_matcher = TeamMatcher(
+            participants=st.session_state.participants,
+            weight_skills=weight_skills,
+            weight_experience=weight_experience,
+            weight_interests=weight_interests
+        )
+        st.session_state.team_matcher_weights = weights
+    return st.session_state.team_matcher
 
 
 def render():
@@ -122,6 +152,8 @@ def render_registration():
                     st.error("❌ Participant with this email already registered!")
                 else:
                     st.session_state.participants.append(participant)
+                    st.session_state.participants_df = None
+                    st.session_state.team_matcher = None
                     st.success(f"✅ {name} registered successfully!")
                     st.balloons()
             else:
@@ -135,20 +167,20 @@ def render_participants_view():
         st.info("No participants registered yet. Go to the 'Register' tab to add participants!")
         return
 
-    df = pd.DataFrame(st.session_state.participants)
+    df = get_participants_df()
 
-    # Summary metrics
+    # Summary metrics, counted straight off the boolean masks instead of copying filtered frames
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Participants", len(df))
     with col2:
-        beginners = len(df[df['experience_level'] == 'Beginner'])
+        beginners = int((df['experience_level'] == 'Beginner').sum())
         st.metric("Beginners", beginners)
     with col3:
-        experts = len(df[df['experience_level'].isin(['Advanced', 'Expert'])])
+        experts = int(df['experience_level'].isin(['Advanced', 'Expert']).sum())
         st.metric("Advanced/Expert", experts)
     with col4:
-        leaders = len(df[df['leadership_interest'] == True])
+        leaders = int((df['leadership_interest'] == True).sum())
         st.metric("Potential Leaders", leaders)
 
     # Visualizations
@@ -157,17 +189,15 @@ def render_participants_view():
     with col1:
         # Experience distribution
         exp_counts = df['experience_level'].value_counts()
-        fig_exp = px.pie(values=exp_counts.values, names=exp_counts.index,
-                         title="Experience Level Distribution",
-                         color_discrete_sequence=px.colors.qualitative.Set3)
+        fig_exp = build_pie_chart(exp_counts, "Experience Level Distribution",
+                                  colors=px.colors.qualitative.Set3)
         st.plotly_chart(fig_exp, use_container_width=True)
 
     with col2:
         # Role preferences
         role_counts = df['role_preference'].value_counts()
-        fig_role = px.bar(x=role_counts.values, y=role_counts.index,
-                          orientation='h', title="Role Preferences",
-                          color_discrete_sequence=px.colors.qualitative.Pastel)
+        fig_role = build_bar_chart(role_counts, "Role Preferences", horizontal=True,
+                                   colors=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_role, use_container_width=True)
 
     # Search and filter
@@ -178,13 +208,7 @@ def render_participants_view():
     # Filter participants
     filtered_participants = df
     if search_term:
-        mask = (
-                df['name'].str.contains(search_term, case=False, na=False) |
-                df['role_preference'].str.contains(search_term, case=False, na=False) |
-                df['bio'].str.contains(search_term, case=False, na=False) |
-                df['programming_langs'].astype(str).str.contains(search_term, case=False, na=False) |
-                df['interests'].astype(str).str.contains(search_term, case=False, na=False)
-        )
+        mask = df['_search_text'].str.contains(search_term.lower(), regex=False)
         filtered_participants = df[mask]
 
     # Display participants
@@ -280,8 +304,7 @@ def render_teams_view():
                 col1, col2 = st.columns([2, 1])
 
                 with col1:
-                    fig = px.bar(x=role_counts.index, y=role_counts.values,
-                                 title=f"Team {i + 1} Role Distribution")
+                    fig = build_bar_chart(role_counts, f"Team {i + 1} Role Distribution")
                     st.plotly_chart(fig, use_container_width=True)
 
                 with col2:
@@ -296,8 +319,8 @@ def render_teams_view():
                     for member in team['members']:
                         all_skills.extend(member.get('programming_langs', []))
                         all_skills.extend(member.get('frameworks', []))
-                    common_skills = pd.Series(all_skills).value_counts().head(3)
-                    st.write(f"**Top Skills:** {', '.join(common_skills.index)}")
+                    common_skills = Counter(all_skills).most_common(3)
+                    st.write(f"**Top Skills:** {', '.join(skill for skill, count in common_skills)}")
 
             # Team members
             st.markdown("### Team Members")
@@ -320,12 +343,8 @@ def generate_optimal_teams(num_teams, team_size, balance_priority, include_leade
 
     with st.spinner("🧠 Analyzing participants and generating optimal teams..."):
         try:
-            team_matcher = TeamMatcher(
-                participants=st.session_state.participants,
-                weight_skills=weight_skills,
-                weight_experience=weight_experience,
-                weight_interests=weight_interests
-            )
+            # Reused across clicks, so only the shuffle and team building rerun
+            team_matcher = get_team_matcher(weight_skills, weight_experience, weight_interests)
 
             teams = team_matcher.generate_teams(
                 num_teams=num_teams,
@@ -349,7 +368,7 @@ def generate_team_ai_insights(team, team_number):
         return
 
     try:
-        gemini_client = GeminiClient(st.session_state.gemini_api_key)
+        gemini_client = get_gemini_client(st.session_state.gemini_api_key)
 
         # Prepare team data for AI analysis
         team_summary = f"""
@@ -377,11 +396,10 @@ Give brief strengths, challenges, and project recommendations. 3-4 sentences tot
 
 def get_avg_experience(experience_levels):
     """Calculate average experience level"""
-    exp_mapping = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
     if not experience_levels:
         return "N/A"
 
-    avg = sum(exp_mapping.get(level, 1) for level in experience_levels) / len(experience_levels)
+    avg = sum(EXPERIENCE_SCORES.get(level, 1) for level in experience_levels) / len(experience_levels)
     return f"{avg:.1f}/4"
 
 
@@ -0,0 +1,18 @@
+author="Vatsal Varshney"
+import streamlit as st
+import plotly.express as px
+
+
+@st.cache_data(show_spinner=False)
+def build_pie_chart(counts, title, colors=None):
+    """Build a pie chart from value counts, reusing the figure while the counts are unchanged"""
+    return px.pie(values=counts.values, names=counts.index, title=title, color_discrete_sequence=colors)
+
+
+@st.cache_data(show_spinner=False)
+def build_bar_chart(counts, title, horizontal=False, colors=None):
+    """Build a bar chart from value counts, reusing the figure while the counts are unchanged"""
+    if horizontal:
+        return px.bar(x=counts.values, y=counts.index, orientation='h', title=title,
+                      color_discrete_sequence=colors)
+    return px.bar(x=counts.index, y=counts.values, title=title, color_discrete_sequence=colors)
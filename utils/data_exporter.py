@@ -2,6 +2,7 @@ author="Vatsal Varshney"
 import pandas as pd
 import json
 import os
+from io import BytesIO
 from datetime import datetime
 import logging
 
@@ -31,15 +32,7 @@ class DataExporter:
             if not filename:
                 filename = self.generate_filename("hackathons", "csv")
 
-            df = pd.DataFrame(data)
-
-            # Handle list columns by converting to string
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    # Check if any cell contains a list
-                    if any(isinstance(cell, list) for cell in df[col] if pd.notna(cell)):
-                        df[col] = df[col].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-
+            df = self.flatten_list_columns(pd.DataFrame(data))
             df.to_csv(filename, index=False)
             logger.info(f"Data exported to CSV: {filename}")
             return filename
@@ -70,30 +63,7 @@ class DataExporter:
             if not filename:
                 filename = self.generate_filename("hackathons", "xlsx")
 
-            df = pd.DataFrame(data)
-
-            # Handle list columns by converting to string
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    if any(isinstance(cell, list) for cell in df[col] if pd.notna(cell)):
-                        df[col] = df[col].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Hackathons', index=False)
-
-                # Add summary sheet if data has multiple entries
-                if len(data) > 1:
-                    summary_data = {
-                        'Total Hackathons': [len(data)],
-                        'Export Date': [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-                        'Online Events': [len([h for h in data if h.get('location_type') == 'Online'])],
-                        'In-person Events': [len([h for h in data if h.get('location_type') == 'In-person'])],
-                        'Hybrid Events': [len([h for h in data if h.get('location_type') == 'Hybrid'])]
-                    }
-
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='Summary', index=False)
-
+            self.write_excel(data, filename)
             logger.info(f"Data exported to Excel: {filename}")
             return filename
 
@@ -101,6 +71,50 @@ class DataExporter:
             logger.error(f"Error exporting to Excel: {e}")
             raise e
 
+    def flatten_list_columns(self, df):
+        """Join list cells into comma-separated strings for tabular formats"""
+        for col in df.columns:
+            if df[col].dtype == 'object':
+                # Check if any cell contains a list
+                if any(isinstance(cell, list) for cell in df[col]):
+                    df[col] = df[col].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
+        return df
+
+    def write_excel(self, data, target):
+        """Write data and a summary sheet as an Excel workbook to a path or buffer"""
+        df = self.flatten_list_columns(pd.DataFrame(data))
+
+        with pd.ExcelWriter(target, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Hackathons', index=False)
+
+            # Add summary sheet if data has multiple entries
+            if len(data) > 1:
+                summary_data = {
+                    'Total Hackathons': [len(data)],
+                    'Export Date': [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+                    'Online Events': [len([h for h in data if h.get('location_type') == 'Online'])],
+                    'In-person Events': [len([h for h in data if h.get('location_type') == 'In-person'])],
+                    'Hybrid Events': [len([h for h in data if h.get('location_type') == 'Hybrid'])]
+                }
+
+                summary_df = pd.DataFrame(summary_data)
+                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+
+    def to_csv_bytes(self, data):
+        """Serialize data to CSV bytes in memory"""
+        df = self.flatten_list_columns(pd.DataFrame(data))
+        return df.to_csv(index=False).encode('utf-8')
+
+    def to_json_bytes(self, data):
+        """Serialize data to JSON bytes in memory"""
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+    def to_excel_bytes(self, data):
+        """Serialize data to Excel workbook bytes in memory"""
+        buffer = BytesIO()
+        self.write_excel(data, buffer)
+        return buffer.getvalue()
+
     def export_teams_to_csv(self, teams_data, filename=None):
         """Export teams data to CSV format"""
         try:
@@ -1,43 +1,66 @@
 author="Vatsal Varshney"
 from datetime import datetime, date
+import pandas as pd
 import re
 
 
+def parse_iso_date(date_str):
+    """Parse an ISO date string to its calendar date, or None if it is not one"""
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except ValueError:
+        return None
+
+
 class HackathonFilter:
     """Filter hackathon data based on various criteria"""
 
     def __init__(self, hackathons_data):
         self.original_data = hackathons_data.copy()
-        self.filtered_data = hackathons_data.copy()
+        self.df = pd.DataFrame(self.original_data)
+        self.mask = pd.Series(True, index=self.df.index)
         self.applied_filters = []
 
+        # Pre-parse dates and explode tags once so every filter is a vectorized column operation.
+        # Dates keep the calendar day as written, so offset-bearing timestamps stay naive and comparable
+        self.dates = pd.to_datetime(self._text_column('date').map(parse_iso_date))
+        self.tags = self._lower_tags()
+
+    def _text_column(self, name):
+        """Get a column as strings, with missing values as empty strings"""
+        if name not in self.df.columns:
+            return pd.Series('', index=self.df.index, dtype=object)
+        return self.df[name].fillna('').astype(str)
+
+    def _lower_tags(self):
+        """Get lowercased tags as one row per tag, indexed by hackathon row"""
+        if 'tags' not in self.df.columns:
+            return pd.Series(dtype=object)
+        is_list = self.df['tags'].map(lambda tags: isinstance(tags, list))
+        return self.df['tags'][is_list].explode().dropna().astype(str).str.lower()
+
+    def _any_tag(self, tag_matches):
+        """Reduce a per-tag boolean Series to one value per hackathon row"""
+        return tag_matches.groupby(level=0).any().reindex(self.df.index, fill_value=False).astype(bool)
+
+    @property
+    def filtered_data(self):
+        """Get the hackathons matching the filters applied so far"""
+        return self.get_results()
+
     def search_text(self, search_term):
         """Filter by text search in title, description, tags"""
         if not search_term:
             return self
 
         search_term = search_term.lower()
-        filtered = []
-
-        for hackathon in self.filtered_data:
-            # Search in title
-            if search_term in hackathon.get('title', '').lower():
-                filtered.append(hackathon)
-                continue
-
-            # Search in description
-            if search_term in hackathon.get('description', '').lower():
-                filtered.append(hackathon)
-                continue
-
-            # Search in tags
-            tags = hackathon.get('tags', [])
-            if isinstance(tags, list):
-                if any(search_term in tag.lower() for tag in tags):
-                    filtered.append(hackathon)
-                    continue
-
-        self.filtered_data = filtered
+        matches = (
+            self._text_column('title').str.lower().str.contains(search_term, regex=False) |
+            self._text_column('description').str.lower().str.contains(search_term, regex=False) |
+            self._any_tag(self.tags.str.contains(search_term, regex=False))
+        )
+
+        self.mask &= matches
         self.applied_filters.append(f"Text: '{search_term}'")
         return self
 
@@ -46,35 +69,17 @@ class HackathonFilter:
         if not start_date and not end_date:
             return self
 
-        filtered = []
-        for hackathon in self.filtered_data:
-            hackathon_date_str = hackathon.get('date', '')
-            if not hackathon_date_str:
-                continue
-
-            try:
-                hackathon_date = datetime.fromisoformat(hackathon_date_str).date()
-
-                # Check start date
-                if start_date:
-                    if isinstance(start_date, str):
-                        start_date = datetime.fromisoformat(start_date).date()
-                    if hackathon_date < start_date:
-                        continue
-
-                # Check end date
-                if end_date:
-                    if isinstance(end_date, str):
-                        end_date = datetime.fromisoformat(end_date).date()
-                    if hackathon_date > end_date:
-                        continue
-
-                filtered.append(hackathon)
-
-            except ValueError:
-                continue
-
-        self.filtered_data = filtered
+        matches = self.dates.notna()
+        if start_date:
+            if isinstance(start_date, str):
+                start_date = datetime.fromisoformat(start_date).date()
+            matches &= self.dates >= pd.Timestamp(start_date)
+        if end_date:
+            if isinstance(end_date, str):
+                end_date = datetime.fromisoformat(end_date).date()
+            matches &= self.dates <= pd.Timestamp(end_date)
+
+        self.mask &= matches
         filter_desc = f"Date: {start_date or 'any'} to {end_date or 'any'}"
         self.applied_filters.append(filter_desc)
         return self
@@ -84,12 +89,7 @@ class HackathonFilter:
         if not location_type:
             return self
 
-        filtered = []
-        for hackathon in self.filtered_data:
-            if hackathon.get('location_type', '').lower() == location_type.lower():
-                filtered.append(hackathon)
-
-        self.filtered_data = filtered
+        self.mask &= self._text_column('location_type').str.lower() == location_type.lower()
         self.applied_filters.append(f"Location Type: {location_type}")
         return self
 
@@ -99,14 +99,7 @@ class HackathonFilter:
             return self
 
         location_name = location_name.lower()
-        filtered = []
-
-        for hackathon in self.filtered_data:
-            location = hackathon.get('location', '').lower()
-            if location_name in location:
-                filtered.append(hackathon)
-
-        self.filtered_data = filtered
+        self.mask &= self._text_column('location').str.lower().str.contains(location_name, regex=False)
         self.applied_filters.append(f"Location: {location_name}")
         return self
 
@@ -116,14 +109,7 @@ class HackathonFilter:
             return self
 
         sources = [s.lower() for s in sources]
-        filtered = []
-
-        for hackathon in self.filtered_data:
-            source = hackathon.get('source', '').lower()
-            if source in sources:
-                filtered.append(hackathon)
-
-        self.filtered_data = filtered
+        self.mask &= self._text_column('source').str.lower().isin(sources)
         self.applied_filters.append(f"Sources: {', '.join(sources)}")
         return self
 
@@ -133,56 +119,32 @@ class HackathonFilter:
             return self
 
         tags = [tag.lower().strip() for tag in tags]
-        filtered = []
-
-        for hackathon in self.filtered_data:
-            hackathon_tags = hackathon.get('tags', [])
-            if isinstance(hackathon_tags, list):
-                hackathon_tags_lower = [tag.lower() for tag in hackathon_tags]
-                if any(tag in hackathon_tags_lower for tag in tags):
-                    filtered.append(hackathon)
-
-        self.filtered_data = filtered
+        self.mask &= self._any_tag(self.tags.isin(tags))
         self.applied_filters.append(f"Tags: {', '.join(tags)}")
         return self
 
     def filter_upcoming_only(self):
         """Filter to show only upcoming hackathons"""
-        today = date.today()
-        filtered = []
-
-        for hackathon in self.filtered_data:
-            hackathon_date_str = hackathon.get('date', '')
-            if not hackathon_date_str:
-                continue
-
-            try:
-                hackathon_date = datetime.fromisoformat(hackathon_date_str).date()
-                if hackathon_date >= today:
-                    filtered.append(hackathon)
-            except ValueError:
-                continue
-
-        self.filtered_data = filtered
+        self.mask &= self.dates.notna() & (self.dates >= pd.Timestamp(date.today()))
         self.applied_filters.append("Upcoming only")
         return self
 
     def get_results(self):
         """Get filtered results"""
-        return self.filtered_data
+        return [self.original_data[row] for row in self.df.index[self.mask]]
 
     def get_stats(self):
         """Get filtering statistics"""
+        filtered_count = int(self.mask.sum())
         return {
             'original_count': len(self.original_data),
-            'filtered_count': len(self.filtered_data),
+            'filtered_count': filtered_count,
             'applied_filters': self.applied_filters,
-            'filter_effectiveness': len(self.filtered_data) / len(self.original_data) if self.original_data else 0
+            'filter_effectiveness': filtered_count / len(self.original_data) if self.original_data else 0
         }
 
     def reset(self):
         """Reset filters to original data"""
-        self.filtered_data = self.original_data.copy()
+        self.mask = pd.Series(True, index=self.df.index)
         self.applied_filters = []
         return self
-        return self
\ No newline at end of file
@@ -1,11 +1,15 @@
 author="Vatsal Varshney"
 import os
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
 from google import genai
 from google.genai import types
 import logging
 
 logger = logging.getLogger(__name__)
 
+EMPTY_RESPONSE = "Sorry, I couldn't generate a response."
+
 
 class GeminiClient:
     """Client for interacting with Google Gemini AI"""
@@ -17,24 +21,64 @@ class GeminiClient:
 
         self.client = genai.Client(api_key=self.api_key)
 
-    def generate_response(self, prompt, model="gemini-2.5-flash", temperature=0.7, max_tokens=300):
+    def generate_response(self, prompt, model="gemini-2.5-flash", temperature=0.7, max_tokens=300,
+                          system_instruction=None):
         """Generate a response using Gemini"""
         try:
+            # A static system instruction keeps the request prefix identical across calls,
+            # which lets Gemini reuse its implicit prompt cache
             response = self.client.models.generate_content(
                 model=model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
                     temperature=temperature,
                     max_output_tokens=max_tokens
                 )
             )
 
-            return response.text if response.text else "Sorry, I couldn't generate a response."
+            return response.text if response.text else EMPTY_RESPONSE
 
         except Exception as e:
             logger.error(f"Error generating response: {e}")
             raise e
 
+    def stream_response(self, prompt, model="gemini-2.5-flash", temperature=0.7, max_tokens=300,
+                        system_instruction=None):
+        """Stream a response from Gemini, yielding text chunks as they arrive"""
+        try:
+            stream = self.client.models.generate_content_stream(
+                model=model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens
+                )
+            )
+
+            for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+            raise e
+
+    def generate_batch(self, prompts, model="gemini-2.5-flash", temperature=0.7, max_tokens=300,
+                       system_instruction=None):
+        """Generate responses for several prompts with concurrent calls, one request per prompt, preserving order"""
+        if not prompts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(prompts), 8)) as executor:
+            return list(executor.map(
+                lambda prompt: self.generate_response(prompt, model=model, temperature=temperature,
+                                                      max_tokens=max_tokens,
+                                                      system_instruction=system_instruction),
+                prompts
+            ))
+
     def generate_team_insights(self, team_data):
         """Generate insights for a specific team"""
         prompt = f"""
@@ -150,3 +194,9 @@ class GeminiClient:
         """
 
         return self.generate_response(prompt, temperature=0.5)
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_client(api_key):
+    """Get a shared Gemini client for the given API key"""
+    return GeminiClient(api_key)
@@ -1,12 +1,71 @@
 author="Vatsal Varshney"
 import requests
+from requests.adapters import HTTPAdapter
 import trafilatura
 from datetime import datetime
 import logging
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+PRIZE_PATTERN = re.compile(r'\d[\d,]*')
+
+# Sample events returned by the placeholder parsers, defined once instead of per call
+DEVPOST_SAMPLES = (
+    {
+        'title': 'Sample AI Hackathon',
+        'description': 'Build innovative AI solutions',
+        'date': '2025-09-15',
+        'location': 'Online',
+        'location_type': 'Online',
+        'source': 'devpost',
+        'tags': ['AI', 'Machine Learning'],
+        'prize': '$10,000'
+    },
+    {
+        'title': 'Web3 Innovation Challenge',
+        'description': 'Create the next generation of decentralized apps',
+        'date': '2025-10-01',
+        'location': 'San Francisco, CA',
+        'location_type': 'In-person',
+        'source': 'devpost',
+        'tags': ['Blockchain', 'Web3'],
+        'prize': '$25,000'
+    },
+)
+
+HACKATHON_IO_SAMPLES = (
+    {
+        'title': 'Healthcare Innovation Hackathon',
+        'description': 'Solve healthcare challenges with technology',
+        'date': '2025-09-20',
+        'location': 'Boston, MA',
+        'location_type': 'Hybrid',
+        'source': 'hackathon.io',
+        'tags': ['Healthcare', 'Innovation'],
+        'prize': '$15,000'
+    },
+)
+
+HACKEREARTH_SAMPLES = (
+    {
+        'title': 'Sustainability Tech Challenge',
+        'description': 'Build solutions for environmental sustainability',
+        'date': '2025-10-15',
+        'location': 'Online',
+        'location_type': 'Online',
+        'source': 'hackerearth',
+        'tags': ['Sustainability', 'Environment'],
+        'prize': '$8,000'
+    },
+)
+
+
+def sample_hackathons(samples, url):
+    """Copy sample events for a page, so callers can annotate them without touching the constants"""
+    return [{**sample, 'url': url, 'tags': list(sample['tags'])} for sample in samples]
+
 
 class HackathonScraper:
     """Scrape hackathon events from various sources"""
@@ -17,50 +76,94 @@ class HackathonScraper:
             'hackathon_io': 'https://hackathon.io/events',
             'hackerearth': 'https://www.hackerearth.com/challenges/',
         }
+        self.parsers = {
+            'devpost': self.parse_devpost,
+            'hackathon_io': self.parse_hackathon_io,
+            'hackerearth': self.parse_hackerearth,
+        }
+
+        # One pooled session so repeat fetches reuse open connections
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; HackHub/1.0)'
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def scrape_all(self):
         """Scrape hackathons from all sources"""
         all_hackathons = []
-
-        for source_name, url in self.sources.items():
-            try:
-                hackathons = self.scrape_source(source_name, url)
-                all_hackathons.extend(hackathons)
-                time.sleep(1)  # Be respectful to servers
-            except Exception as e:
-                logger.error(f"Error scraping {source_name}: {e}")
-                continue
+        seen = set()
+
+        # Each source lives on its own host, so fetch them concurrently; results
+        # are still collected in source order to keep the listing stable
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+            futures = [
+                (source_name, executor.submit(self.scrape_source, source_name, url))
+                for source_name, url in self.sources.items()
+            ]
+
+            for source_name, future in futures:
+                try:
+                    hackathons = future.result() or []
+                except Exception as e:
+                    logger.error(f"Error scraping {source_name}: {e}")
+                    continue
+
+                # Skip events already listed, e.g. by a mirrored page of the same source
+                for hackathon in hackathons:
+                    key = self.hackathon_key(hackathon)
+                    if key not in seen:
+                        seen.add(key)
+                        all_hackathons.append(hackathon)
 
         return all_hackathons
 
+    def hackathon_key(self, hackathon):
+        """Get the key identifying a hackathon across scraped pages"""
+        return (
+            str(hackathon.get('title', '')).strip().lower(),
+            hackathon.get('date', ''),
+            hackathon.get('source', ''),
+        )
+
     def scrape_source(self, source_name, url):
         """Scrape hackathons from a specific source"""
         try:
+            # Look up the parser first so unknown sources are never fetched
+            parser = self.parsers.get(source_name)
+            if parser is None:
+                return []
+
             # Get website content
             content = self.get_website_content(url)
             if not content:
                 return []
 
-            # Parse hackathons based on source
-            if source_name == 'devpost':
-                return self.parse_devpost(content, url)
-            elif source_name == 'hackathon_io':
-                return self.parse_hackathon_io(content, url)
-            elif source_name == 'hackerearth':
-                return self.parse_hackerearth(content, url)
-            else:
-                return []
+            hackathons = parser(content, url)
+
+            # Extract the numeric prize once so prize filters compare numbers, not strings
+            for hackathon in hackathons:
+                if 'prize_amount' not in hackathon:
+                    hackathon['prize_amount'] = self.parse_prize_amount(hackathon.get('prize'))
+            return hackathons
 
         except Exception as e:
             logger.error(f"Error scraping {source_name}: {e}")
             return []
 
+    def parse_prize_amount(self, prize):
+        """Get the amount of a prize like '$10,000', or 0 if it has none"""
+        # Parsers may hand over numbers as well as strings
+        match = PRIZE_PATTERN.search(str(prize or ''))
+        return int(match.group().replace(',', '')) if match else 0
+
     def get_website_content(self, url):
         """Get text content from website using trafilatura"""
         try:
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded:
-                text = trafilatura.extract(downloaded)
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            if response.text:
+                text = trafilatura.extract(response.text)
                 return text
             return None
         except Exception as e:
@@ -69,73 +172,14 @@ class HackathonScraper:
 
     def parse_devpost(self, content, url):
         """Parse Devpost hackathons"""
-        hackathons = []
-
         # This is a simplified parser - in reality, you'd need more sophisticated parsing
         # Since we can't make actual web requests, we'll return sample data structure
-        sample_hackathons = [
-            {
-                'title': 'Sample AI Hackathon',
-                'description': 'Build innovative AI solutions',
-                'date': '2025-09-15',
-                'location': 'Online',
-                'location_type': 'Online',
-                'source': 'devpost',
-                'url': url,
-                'tags': ['AI', 'Machine Learning'],
-                'prize': '$10,000'
-            },
-            {
-                'title': 'Web3 Innovation Challenge',
-                'description': 'Create the next generation of decentralized apps',
-                'date': '2025-10-01',
-                'location': 'San Francisco, CA',
-                'location_type': 'In-person',
-                'source': 'devpost',
-                'url': url,
-                'tags': ['Blockchain', 'Web3'],
-                'prize': '$25,000'
-            }
-        ]
-
-        return sample_hackathons
+        return sample_hackathons(DEVPOST_SAMPLES, url)
 
     def parse_hackathon_io(self, content, url):
         """Parse Hackathon.io events"""
-        hackathons = []
-
-        sample_hackathons = [
-            {
-                'title': 'Healthcare Innovation Hackathon',
-                'description': 'Solve healthcare challenges with technology',
-                'date': '2025-09-20',
-                'location': 'Boston, MA',
-                'location_type': 'Hybrid',
-                'source': 'hackathon.io',
-                'url': url,
-                'tags': ['Healthcare', 'Innovation'],
-                'prize': '$15,000'
-            }
-        ]
-
-        return sample_hackathons
+        return sample_hackathons(HACKATHON_IO_SAMPLES, url)
 
     def parse_hackerearth(self, content, url):
         """Parse HackerEarth challenges"""
-        hackathons = []
-
-        sample_hackathons = [
-            {
-                'title': 'Sustainability Tech Challenge',
-                'description': 'Build solutions for environmental sustainability',
-                'date': '2025-10-15',
-                'location': 'Online',
-                'location_type': 'Online',
-                'source': 'hackerearth',
-                'url': url,
-                'tags': ['Sustainability', 'Environment'],
-                'prize': '$8,000'
-            }
-        ]
-
-        return sample_hackathons
\ No newline at end of file
+        return sample_hackathons(HACKEREARTH_SAMPLES, url)
\ No newline at end of file
@@ -1,8 +1,12 @@
 import random
 import logging
+from collections import Counter
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+EXPERIENCE_SCORES = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
+
 
 class TeamMatcher:
     """Simple team matching for hackathon team formation"""
@@ -10,26 +14,39 @@ class TeamMatcher:
     def __init__(self, participants, weight_skills=0.3, weight_experience=0.3, weight_interests=0.4):
         self.participants = participants
 
+        # Extract what team building needs once, so teams can be handled as index lists
+        self.experience_scores = [EXPERIENCE_SCORES.get(p.get('experience_level', 'Beginner'), 1) for p in participants]
+        self.roles = [p.get('role_preference', '') for p in participants]
+        self.is_leader = [bool(p.get('leadership_interest', False)) for p in participants]
+        self.skill_bags = [(*p.get('programming_langs', []), *p.get('frameworks', [])) for p in participants]
+        self.interest_bags = [tuple(p.get('interests', [])) for p in participants]
+
     def generate_teams(self, num_teams, team_size, balance_priority="Skill Diversity", include_leadership=True):
         """Generate teams using simple balanced distribution"""
         try:
             if len(self.participants) < num_teams * 2:
                 raise ValueError("Not enough participants to form meaningful teams")
 
+            # A single team is everyone; shuffling and leader redistribution can't change it
+            if num_teams == 1:
+                formatted_teams = self.format_teams([list(range(len(self.participants)))])
+                logger.info("Generated 1 team successfully")
+                return formatted_teams
+
             # Simple team formation by shuffling and distributing
-            participants_copy = self.participants.copy()
-            random.shuffle(participants_copy)
+            participant_ids = list(range(len(self.participants)))
+            random.shuffle(participant_ids)
 
             teams = []
-            participants_per_team = len(participants_copy) // num_teams
+            participants_per_team = len(participant_ids) // num_teams
 
             for i in range(num_teams):
                 start_idx = i * participants_per_team
                 if i == num_teams - 1:  # Last team gets remaining participants
-                    team_members = participants_copy[start_idx:]
+                    team_members = participant_ids[start_idx:]
                 else:
                     end_idx = start_idx + participants_per_team
-                    team_members = participants_copy[start_idx:end_idx]
+                    team_members = participant_ids[start_idx:end_idx]
 
                 if team_members:
                     teams.append(team_members)
@@ -56,36 +73,20 @@ class TeamMatcher:
 
         for team in teams:
             for member in team:
-                if member.get('leadership_interest', False):
+                if self.is_leader[member]:
                     leaders.append(member)
                 else:
                     non_leaders.append(member)
 
-        # Redistribute to ensure each team has a leader if possible
-        if len(leaders) >= len(teams):
-            new_teams = []
-            leaders_distributed = 0
-
-            for i, team in enumerate(teams):
-                new_team = []
-                # Add one leader to each team
-                if leaders_distributed < len(leaders):
-                    new_team.append(leaders[leaders_distributed])
-                    leaders_distributed += 1
-
-                # Fill remaining spots with non-leaders and extra leaders
-                remaining_members = (len(team) - 1) if len(team) > 0 else 0
-                available_members = non_leaders + leaders[leaders_distributed:]
-
-                for j in range(min(remaining_members, len(available_members))):
-                    if available_members:
-                        new_team.append(available_members.pop(0))
-
-                new_teams.append(new_team)
-
-            return new_teams
+        # Not enough leaders to go around, keep the teams as they are
+        if len(leaders) < len(teams):
+            return teams
 
-        return teams
+        # Give each team one leader, then fill its remaining spots from a single
+        # shared pool of non-leaders and extra leaders so nobody is placed twice
+        available_members = iter(non_leaders + leaders[len(teams):])
+        return [[leader] + list(islice(available_members, len(team) - 1))
+                for leader, team in zip(leaders, teams)]
 
     def format_teams(self, teams):
         """Format teams for output"""
@@ -93,46 +94,33 @@ class TeamMatcher:
 
         for i, team_members in enumerate(teams):
             if team_members:  # Only include teams with actual members
-                team_data = {
-                    'id': i + 1,
-                    'members': team_members,
-                    'size': len(team_members),
-                    'avg_experience': self.calculate_team_experience(team_members),
-                    'role_diversity': len(set(m.get('role_preference', '') for m in team_members)),
-                    'has_leader': any(m.get('leadership_interest', False) for m in team_members),
-                    'common_skills': self.get_common_skills(team_members),
-                    'common_interests': self.get_common_interests(team_members)
-                }
-                formatted_teams.append(team_data)
+                formatted_teams.append(self.summarize_team(i + 1, team_members))
 
         return formatted_teams
 
-    def calculate_team_experience(self, members):
-        """Calculate average team experience level"""
-        exp_mapping = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
-        experiences = [exp_mapping.get(m.get('experience_level', 'Beginner'), 1) for m in members]
-        return sum(experiences) / len(experiences) if experiences else 1.0
-
-    def get_common_skills(self, members):
-        """Get most common skills in team"""
-        skill_count = {}
-        for member in members:
-            for skill in member.get('programming_langs', []):
-                skill_count[skill] = skill_count.get(skill, 0) + 1
-            for skill in member.get('frameworks', []):
-                skill_count[skill] = skill_count.get(skill, 0) + 1
-
-        # Return top 5 skills sorted by frequency
-        sorted_skills = sorted(skill_count.items(), key=lambda x: x[1], reverse=True)
-        return [skill for skill, count in sorted_skills[:5]]
-
-    def get_common_interests(self, members):
-        """Get most common interests in team"""
-        interest_count = {}
-        for member in members:
-            for interest in member.get('interests', []):
-                interest_count[interest] = interest_count.get(interest, 0) + 1
-
-        # Return top 3 interests sorted by frequency
-        sorted_interests = sorted(interest_count.items(), key=lambda x: x[1], reverse=True)
-        return [interest for interest, count in sorted_interests[:3]]
+    def summarize_team(self, team_id, member_ids):
+        """Build a team's output dict in a single pass over its members"""
+        experience_total = 0
+        roles = set()
+        has_leader = False
+        skill_count = Counter()
+        interest_count = Counter()
+
+        for i in member_ids:
+            experience_total += self.experience_scores[i]
+            roles.add(self.roles[i])
+            has_leader = has_leader or self.is_leader[i]
+            skill_count.update(self.skill_bags[i])
+            interest_count.update(self.interest_bags[i])
+
+        return {
+            'id': team_id,
+            'members': [self.participants[i] for i in member_ids],
+            'size': len(member_ids),
+            'avg_experience': experience_total / len(member_ids),
+            'role_diversity': len(roles),
+            'has_leader': has_leader,
+            # Top 5 skills and top 3 interests by frequency
+            'common_skills': [skill for skill, count in skill_count.most_common(5)],
+            'common_interests': [interest for interest, count in interest_count.most_common(3)]
+        }